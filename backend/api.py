@@ -1,27 +1,57 @@
+import asyncio
+import logging
 import os
 import sys
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import aiofiles
+import aiofiles.os
+import anyio
+import orjson
 import uvicorn
 from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from google.adk.cli.fast_api import get_fast_api_app
 from dotenv import load_dotenv
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-import json
+from typing import List, Optional, Dict, Any, Tuple
+
+from adk_agents import agent
 
 load_dotenv()
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 AGENT_DIR = BASE_DIR  
 SESSION_DB_URL = f"sqlite:///{os.path.join(BASE_DIR, 'sessions.db')}"
 STATIC_DIR = os.path.join(BASE_DIR, "static")
+SESSION_CACHE_MAX = 1024
+HISTORY_MAX = 1024
+# Worker threads available to sync endpoints and file responses
+THREADPOOL_SIZE = 100
 
-# Chat API Models
-class Message(BaseModel):
-    role: str
-    text: str
-    time: Optional[float] = None
+logger = logging.getLogger(__name__)
+
+# session_id -> ((mtime_ns, size), parsed session), least recently used first
+SESSION_CACHE: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+
+# Session ids with a "<session_id>.json" file in the working directory. Listed once
+# at startup and updated on write, so lookups for unknown sessions skip the stat/open.
+with os.scandir(".") as _entries:
+    KNOWN_SESSIONS = {e.name[:-5] for e in _entries if e.name.endswith(".json") and e.is_file()}
+
+# session_id -> chat history, loaded from file once and appended to per /chat turn,
+# least recently used first. Messages are plain dicts ({"role", "text", "time"}) so
+# they are serialized without building a model per message.
+HISTORY: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
 
+# session_id -> lock serializing reads and writes of "<session_id>.json"
+_SESSION_LOCKS: Dict[str, asyncio.Lock] = {}
+
+# Strong references to in-flight session writes so they are not garbage collected
+_PENDING_WRITES: "set[asyncio.Task]" = set()
+
+# Chat API Models
 class ChatRequest(BaseModel):
     message: str
     session_id: Optional[str] = None  # if not provided, use default session
@@ -29,58 +59,136 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     response: str
     session_id: str
-    history: Optional[List[Message]] = None
+    history: Optional[List[Dict[str, Any]]] = None
 
-def _load_session_from_file(session_id: str) -> Optional[Dict[str, Any]]:
-    """Helper to load session data from file if it exists."""
+async def _load_session_from_file(session_id: str) -> Optional[Dict[str, Any]]:
+    """Helper to load session data from file if it exists.
+
+    Parsed sessions are cached and reused until the file's mtime or size changes.
+    """
+    if session_id not in KNOWN_SESSIONS:
+        return None
+    path = f"{session_id}.json"
+    try:
+        st = os.stat(path)
+    except OSError:
+        KNOWN_SESSIONS.discard(session_id)
+        SESSION_CACHE.pop(session_id, None)
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = SESSION_CACHE.get(session_id)
+    if cached is not None and cached[0] == stamp:
+        SESSION_CACHE.move_to_end(session_id)
+        return cached[1]
     try:
-        with open(f"{session_id}.json") as f:
-            return json.load(f)
+        async with aiofiles.open(path, "rb") as f:
+            session_data = orjson.loads(await f.read())
     except Exception:
         return None
+    SESSION_CACHE[session_id] = (stamp, session_data)
+    SESSION_CACHE.move_to_end(session_id)
+    if len(SESSION_CACHE) > SESSION_CACHE_MAX:
+        SESSION_CACHE.popitem(last=False)
+    return session_data
+
+def _history_from_session(session_data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build the chat history from a saved session's events."""
+    if not session_data or "events" not in session_data:
+        return []
+    return [
+        {"role": evt["role"], "text": evt["text"], "time": evt.get("time")}
+        for evt in session_data["events"]
+    ]
+
+def _session_lock(session_id: str) -> asyncio.Lock:
+    return _SESSION_LOCKS.setdefault(session_id, asyncio.Lock())
+
+def _remember_history(session_id: str, history: List[Dict[str, Any]]) -> None:
+    """Store a session's history in HISTORY, evicting the least recently used one."""
+    HISTORY[session_id] = history
+    HISTORY.move_to_end(session_id)
+    if len(HISTORY) > HISTORY_MAX:
+        evicted, _ = HISTORY.popitem(last=False)
+        lock = _SESSION_LOCKS.get(evicted)
+        if lock is not None and not lock.locked():
+            del _SESSION_LOCKS[evicted]
+
+async def _get_history(session_id: str) -> List[Dict[str, Any]]:
+    """Return the in-memory history for a session, loading it from file on first use."""
+    history = HISTORY.get(session_id)
+    if history is not None:
+        HISTORY.move_to_end(session_id)
+        return history
+    # Wait for any in-flight write so the file holds every turn of this session
+    async with _session_lock(session_id):
+        history = HISTORY.get(session_id)
+        if history is None:
+            history = _history_from_session(await _load_session_from_file(session_id))
+    _remember_history(session_id, history)
+    return history
+
+async def _write_session(session_id: str, history: List[Dict[str, Any]]) -> None:
+    """Persist a session's chat history to "<session_id>.json" without blocking the event loop.
+
+    Writes for one session run one at a time; each saves the history as of when it
+    starts, and the file is replaced atomically so readers never see a partial write.
+    """
+    path = f"{session_id}.json"
+    tmp_path = f"{path}.tmp"
+    async with _session_lock(session_id):
+        # Same keys, in the same order, as agent.save_session_to_file writes
+        session_data = {
+            "id": session_id,
+            "session_id": session_id,
+            "app_name": agent.APP_NAME,
+            "user_id": agent.USER_ID,
+            "state": {},
+            "events": list(history),
+            "last_update_time": time.time(),
+        }
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(orjson.dumps(session_data, option=orjson.OPT_INDENT_2))
+            await aiofiles.os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("failed to save session %s", session_id)
+            return
+        KNOWN_SESSIONS.add(session_id)
+
 app: FastAPI = get_fast_api_app(
     agents_dir=AGENT_DIR,
     session_service_uri=SESSION_DB_URL,
-    allow_origins=["*"],  
+    allow_origins=["*"],  # get_fast_api_app installs CORSMiddleware for these origins
     web=True,  
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+_adk_lifespan = app.router.lifespan_context
 
-# Mount static files
-app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Raise the anyio threadpool limit before running the ADK app's own lifespan."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    async with _adk_lifespan(app) as state:
+        yield state
+
+app.router.lifespan_context = _lifespan
 
-@app.get("/")
-async def root():
-    """Redirect to chat interface"""
-    from fastapi.responses import FileResponse
-    return FileResponse(os.path.join(STATIC_DIR, "index.html"))
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
 @app.get("/agent-info")
 async def agent_info():
     """Provide agent information"""
-    from adk_agents import agent
     return {
         "agent_name": agent.root_agent.name,
         "description": agent.root_agent.description,
     }
 
-@app.get("/session-info")
+@app.get("/session-info", response_class=ORJSONResponse)
 async def session_info():
     """Return information about the current session."""
-    from adk_agents import agent
-    
     # Try to load the current session
-    session_data = _load_session_from_file(agent.SESSION_ID)
+    session_data = await _load_session_from_file(agent.SESSION_ID)
     if not session_data:
         return {
             "session_id": agent.SESSION_ID,
@@ -91,37 +199,30 @@ async def session_info():
         }
     return session_data
 
-@app.post("/chat")
+@app.post("/chat", response_class=ORJSONResponse)
 async def chat(req: ChatRequest) -> ChatResponse:
     """Send a message to the agent and get a response.
     
     The message will be added to the session history along with the agent's response.
     """
-    from adk_agents import agent
-
     # Use provided session_id or default from agent
     session_id = req.session_id or agent.SESSION_ID
 
     try:
+        history = await _get_history(session_id)
+
         # Run the query through the agent
+        sent_at = time.time()
         response = await agent.run_query_async(req.message)
-        
-        # Save session to file (this contains the updated history)
-        agent.save_session_to_file(f"{session_id}.json")
-        
-        # Load the saved session to get history
-        session_data = _load_session_from_file(session_id)
-        history = []
-        if session_data and "events" in session_data:
-            history = [
-                Message(
-                    role=evt["role"],
-                    text=evt["text"],
-                    time=evt.get("time")
-                )
-                for evt in session_data["events"]
-            ]
-        print(f"Chat history for session {session_id}: {history}")
+        history.append({"role": "user", "text": req.message, "time": sent_at})
+        history.append({"role": "assistant", "text": response, "time": time.time()})
+
+        # Persist in the background; the response is served from memory
+        task = asyncio.create_task(_write_session(session_id, history))
+        _PENDING_WRITES.add(task)
+        task.add_done_callback(_PENDING_WRITES.discard)
+
+        logger.debug("chat history len=%d session=%s", len(history), session_id)
         return ChatResponse(
             response=response,
             session_id=session_id,
@@ -130,38 +231,24 @@ async def chat(req: ChatRequest) -> ChatResponse:
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/chat/history/{session_id}")
-async def get_chat_history(session_id: str) -> List[Message]:
+@app.get("/chat/history/{session_id}", response_class=ORJSONResponse)
+async def get_chat_history(session_id: str) -> List[Dict[str, Any]]:
     """Get the chat history for a specific session."""
-    session_data = _load_session_from_file(session_id)
-    if not session_data:
+    if session_id not in HISTORY and session_id not in KNOWN_SESSIONS:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
-    
-    history = []
-    if "events" in session_data:
-        history = [
-            Message(
-                role=evt["role"],
-                text=evt["text"],
-                time=evt.get("time")
-            )
-            for evt in session_data["events"]
-        ]
-    return history
+    return await _get_history(session_id)
 
-@app.post("agent_call")
+# Agents that /agent_call can dispatch to, keyed by name
+AGENTS: Dict[str, Any] = {
+    a.name: a for a in (agent.payload_agent, agent.attack_agent, agent.root_agent)
+}
+
+@app.post("/agent_call")
 async def agent_call(agent_name: str, input_data: dict):
     """Endpoint to call a specific agent with input data"""
-    from adk_agents import agent
-    selected_agent = None
-    if agent_name == agent.payload_agent.name:
-        selected_agent = agent.payload_agent
-    elif agent_name == agent.attack_agent.name:
-        selected_agent = agent.attack_agent
-    elif agent_name == agent.root_agent.name:
-        selected_agent = agent.root_agent
-    else:
-        return {"error": "Agent not found"}
+    selected_agent = AGENTS.get(agent_name)
+    if selected_agent is None:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
     # Here you would normally call the agent's method to process input_data
     # For demonstration, we return a mock response
     return {
@@ -170,6 +257,10 @@ async def agent_call(agent_name: str, input_data: dict):
         "response": "This is a mock response from the agent."
     }
 
+# Serve the chat interface; html=True also answers /static/ with index.html.
+# ("/" itself is taken by the ADK web UI redirect registered by get_fast_api_app.)
+app.mount("/static", StaticFiles(directory=STATIC_DIR, html=True), name="static")
+
 if __name__ == "__main__":
     print("Starting FastAPI server...")
     uvicorn.run(
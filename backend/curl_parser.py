@@ -0,0 +1,89 @@
+"""Translate curl commands into aiohttp request arguments."""
+
+import shlex
+from typing import Dict, Optional
+
+import aiohttp
+from multidict import CIMultiDict
+
+
+def parse_curl(curl_command: str) -> Optional[Dict]:
+    """
+    Translate a curl command into aiohttp request arguments.
+
+    Only common options are understood (-X, -H, -d and its variants, -u, -A, -b,
+    -m, -k, -L, -s, -S, --compressed, --url). Returns None when the command uses
+    anything else, so the caller can run it through curl itself. URLs without a
+    scheme get http:// prepended, as curl does.
+    """
+    args = []
+    for arg in shlex.split(curl_command)[1:]:
+        if arg.startswith('-X') and len(arg) > 2:
+            args += ['-X', arg[2:]]
+        elif len(arg) > 2 and arg[0] == '-' and set(arg[1:]) <= set('sSLk'):
+            # Combined switches such as -sSL
+            args += ['-' + c for c in arg[1:]]
+        else:
+            args.append(arg)
+
+    method = None
+    url = None
+    # Header names are case-insensitive, as in curl: a user's 'content-type'
+    # must win over the form default and -A/-b must replace any -H spelling
+    headers = CIMultiDict()
+    data = []
+    request = {'allow_redirects': False}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        value = args[i + 1] if i + 1 < len(args) else None
+        i += 1
+        if arg in ('-s', '--silent', '-S', '--show-error', '--compressed'):
+            continue
+        if arg in ('-L', '--location'):
+            request['allow_redirects'] = True
+            continue
+        if arg in ('-k', '--insecure'):
+            request['ssl'] = False
+            continue
+        if not arg.startswith('-'):
+            if url is not None:
+                return None
+            url = arg
+            continue
+        if value is None:
+            return None
+        i += 1
+        if arg in ('-X', '--request'):
+            method = value
+        elif arg in ('-H', '--header') and ':' in value:
+            name, _, header_value = value.partition(':')
+            headers[name.strip()] = header_value.strip()
+        elif arg in ('-d', '--data', '--data-binary', '--data-ascii') and not value.startswith('@'):
+            data.append(value)
+        elif arg == '--data-raw':
+            data.append(value)
+        elif arg in ('-u', '--user') and ':' in value:
+            user, _, password = value.partition(':')
+            request['auth'] = aiohttp.BasicAuth(user, password)
+        elif arg in ('-A', '--user-agent'):
+            headers['User-Agent'] = value
+        elif arg in ('-b', '--cookie') and '=' in value:
+            headers['Cookie'] = value
+        elif arg in ('-m', '--max-time'):
+            request['timeout'] = aiohttp.ClientTimeout(total=float(value))
+        elif arg == '--url' and url is None:
+            url = value
+        else:
+            return None
+    if url is None:
+        return None
+    if '://' not in url:
+        url = 'http://' + url
+    if data:
+        headers.setdefault('Content-Type', 'application/x-www-form-urlencoded')
+        request['data'] = '&'.join(data)
+    request['method'] = method or ('POST' if data else 'GET')
+    request['url'] = url
+    request['headers'] = headers
+    return request
@@ -3,11 +3,14 @@
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+SEP = "=" * 80
+
 def list_models_ai_studio():
     """List models using Google AI Studio API."""
     try:
@@ -20,9 +23,9 @@ def list_models_ai_studio():
         
         client = Client(api_key=api_key)
         
-        print("=" * 80)
+        print(SEP)
         print("Available Models (Google AI Studio)")
-        print("=" * 80)
+        print(SEP)
         
         models = client.models.list()
         
@@ -61,9 +64,9 @@ def list_models_vertex_ai():
         
         vertexai.init(project=project, location=location)
         
-        print("=" * 80)
+        print(SEP)
         print(f"Available Models (Vertex AI - Project: {project}, Location: {location})")
-        print("=" * 80)
+        print(SEP)
         
         # Common Gemini models to check
         common_models = [
@@ -75,12 +78,15 @@ def list_models_vertex_ai():
         ]
         
         print("\nCommon Gemini Models:")
-        for model_name in common_models:
-            try:
-                model = GenerativeModel(model_name)
-                print(f"  ✓ {model_name} - Available")
-            except Exception as e:
-                print(f"  ✗ {model_name} - Not available: {str(e)[:50]}")
+        # Check the models concurrently; results are still printed in list order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [(name, executor.submit(GenerativeModel, name)) for name in common_models]
+            for model_name, future in futures:
+                try:
+                    future.result()
+                    print(f"  ✓ {model_name} - Available")
+                except Exception as e:
+                    print(f"  ✗ {model_name} - Not available: {str(e)[:50]}")
         
         # Try to get model info using the API
         try:
@@ -109,11 +115,11 @@ def main():
     """Main function to list models."""
     use_vertex = os.environ.get("GOOGLE_GENAI_USE_VERTEXAI", "0").lower() in ("1", "true", "yes")
     
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     print("Google AI Models Listing")
-    print("=" * 80)
+    print(SEP)
     print(f"Configuration: {'Vertex AI' if use_vertex else 'Google AI Studio'}")
-    print("=" * 80 + "\n")
+    print(SEP + "\n")
     
     if use_vertex:
         success = list_models_vertex_ai()
@@ -121,18 +127,18 @@ def main():
         success = list_models_ai_studio()
     
     if not success:
-        print("\n" + "=" * 80)
+        print("\n" + SEP)
         print("Trying alternative method...")
-        print("=" * 80 + "\n")
+        print(SEP + "\n")
         
         if use_vertex:
             list_models_ai_studio()
         else:
             list_models_vertex_ai()
     
-    print("\n" + "=" * 80)
+    print("\n" + SEP)
     print("Model Listing Complete")
-    print("=" * 80)
+    print(SEP)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,8 @@ try:
 except ImportError:
     pass  # Continue without dotenv
 
+SEP = "=" * 80
+
 try:
     from google.genai import Client
     
@@ -26,14 +28,16 @@ try:
     
     client = Client(api_key=api_key)
     
-    print("=" * 80)
+    print(SEP)
     print("Available Google AI Models")
-    print("=" * 80)
+    print(SEP)
     print()
     
     models = client.models.list()
+    count = 0
     
     for model in models:
+        count += 1
         print(f"Model: {model.name}")
         if hasattr(model, 'display_name'):
             print(f"  Display Name: {model.display_name}")
@@ -49,9 +53,9 @@ try:
             print(f"  Output Token Limit: {model.output_token_limit:,}")
         print()
     
-    print("=" * 80)
-    print(f"Total models found: {len(list(models))}")
-    print("=" * 80)
+    print(SEP)
+    print(f"Total models found: {count}")
+    print(SEP)
     
 except ImportError as e:
     print(f"Error: Required library not installed: {e}")
@@ -8,16 +8,37 @@ Usage:
 import json
 import os
 import argparse
-from urllib.parse import urlparse
+import re
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser/serializer
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # build_description_map falls back to a full load
+    ijson = None
+
+# Splits a URL into scheme, netloc and path like urlsplit, without building a result object
+_URL_RE = re.compile(r'(?:(?P<scheme>[a-zA-Z][a-zA-Z0-9+.-]*):)?(?://(?P<netloc>[^/?#]*))?(?P<path>[^?#]*)')
 
 
 def load_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def save_json(path, data):
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(path, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
 
@@ -27,44 +48,64 @@ def form_signature(form):
     action = form.get('action', '').strip()
     method = (form.get('method') or '').upper().strip()
     inputs = form.get('inputs') or []
-    # Signature: sorted tuple of (name,type,required)
-    inputs_sig = tuple(sorted(
-        (
-            (inp.get('name') or '').strip(),
-            (inp.get('type') or '').strip(),
-            bool(inp.get('required'))
-        )
-        for inp in inputs
-    ))
-    return (action, method, inputs_sig)
-
-
-def build_description_map(endpoints_data):
+    # Signature: unordered set of (name,type,required); hashable without sorting
+    inputs_sig = set()
+    add = inputs_sig.add
+    for inp in inputs:
+        get = inp.get
+        add(((get('name') or '').strip(), (get('type') or '').strip(), bool(get('required'))))
+    return (action, method, frozenset(inputs_sig))
+
+
+def _iter_endpoint_items(endpoints_path, prefix):
+    """Yield items of the top-level array `prefix` in endpoints.json.
+
+    Streams with ijson when available so only one record is held in memory;
+    otherwise loads the whole document.
+    """
+    if ijson is not None:
+        with open(endpoints_path, 'rb') as f:
+            yield from ijson.items(f, prefix + '.item')
+        return
+    data = load_json(endpoints_path)
+    if isinstance(data, dict):
+        yield from data.get(prefix, [])
+
+
+def _strip_params(path):
+    """Drop ';params' from the last path segment, as urlparse does."""
+    i = path.find(';', path.rfind('/'))
+    return path if i < 0 else path[:i]
+
+
+def _url_path(url):
+    path = _strip_params(_URL_RE.match(url).group('path')) or '/'
+    # normalize (remove trailing slash except for root)
+    if path != '/' and path.endswith('/'):
+        path = path[:-1]
+    return path
+
+
+def build_description_map(endpoints_path):
     """Return a map from path -> description using attack_surfaces where available.
     Keys are normalized paths (leading slash, no trailing slash unless root).
     """
     desc_map = {}
-    for item in endpoints_data.get('attack_surfaces', []) if isinstance(endpoints_data, dict) else []:
+    for item in _iter_endpoint_items(endpoints_path, 'attack_surfaces'):
+        if not isinstance(item, dict):
+            continue
         url = item.get('url') or ''
         desc = item.get('description') or ''
         if not url:
             continue
         try:
-            p = urlparse(url)
-            path = p.path or '/'
-            # normalize (remove trailing slash except for root)
-            if path != '/' and path.endswith('/'):
-                path = path[:-1]
-            desc_map[path] = desc
+            desc_map[_url_path(url)] = desc
         except Exception:
             continue
     # Also include entries from top-level "endpoints" (no descriptions) as empty string
-    for e in endpoints_data.get('endpoints', []) if isinstance(endpoints_data, dict) else []:
+    for e in _iter_endpoint_items(endpoints_path, 'endpoints'):
         try:
-            p = urlparse(e)
-            path = p.path or '/'
-            if path != '/' and path.endswith('/'):
-                path = path[:-1]
+            path = _url_path(e)
             if path not in desc_map:
                 desc_map[path] = ''
         except Exception:
@@ -72,18 +113,51 @@ def build_description_map(endpoints_data):
     return desc_map
 
 
+def build_tail_index(desc_map):
+    """Index non-empty descriptions by the last path segment.
+
+    Two normalized paths can only be suffixes of one another when their last
+    segments match, so the fuzzy match only needs to check the
+    candidates sharing a tail. Candidates keep desc_map insertion order.
+    """
+    by_tail = {}
+    for path, desc in desc_map.items():
+        if desc:
+            by_tail.setdefault(path.rsplit('/', 1)[-1], []).append((path, desc))
+    return by_tail
+
+
+def build_description_lookup(desc_map):
+    """Return a memoized function mapping a normalized action to its description.
+
+    Tries an exact path match first, then a known path that is a suffix of the
+    action or vice versa. Returns '' when nothing matches. Many forms share an
+    action, so each unique action is resolved once.
+    """
+    by_tail = build_tail_index(desc_map)
+
+    @lru_cache(maxsize=None)
+    def lookup(norm_action):
+        description = desc_map.get(norm_action)
+        if description:
+            return description
+        for path, desc in by_tail.get(norm_action.rsplit('/', 1)[-1], ()):
+            if path.endswith(norm_action) or norm_action.endswith(path):
+                return desc
+        return ''
+
+    return lookup
+
+
+@lru_cache(maxsize=None)
 def normalize_action(action):
     if not action:
         return '/'
-    # If action is full URL, extract path
-    try:
-        p = urlparse(action)
-        if p.scheme and p.netloc:
-            path = p.path or '/'
-        else:
-            # action may be relative like "/login"
-            path = action
-    except Exception:
+    # If action is full URL, extract path; otherwise it may be relative like "/login"
+    m = _URL_RE.match(action)
+    if m.group('scheme') and m.group('netloc'):
+        path = _strip_params(m.group('path')) or '/'
+    else:
         path = action
     if not path.startswith('/'):
         path = '/' + path
@@ -92,6 +166,53 @@ def normalize_action(action):
     return path
 
 
+def iter_unique_forms(forms):
+    """Yield forms whose signature has not been seen yet, in order."""
+    seen = set()
+    for f in forms:
+        sig = form_signature(f)
+        if sig in seen:
+            continue
+        seen.add(sig)
+        yield f
+
+
+def annotate_form(f, describe):
+    """Normalize the form's action and attach its description as `feedback`."""
+    action = f.get('action') or ''
+    norm_action = normalize_action(action)
+    f['action'] = norm_action
+
+    # Attach description from endpoints attack_surfaces if available
+    description = describe(norm_action)
+    if description:
+        f['feedback'] = description
+    else:
+        # leave empty feedback to be explicit
+        f.setdefault('feedback', '')
+    return f
+
+
+def existing_files(paths):
+    """Return the subset of `paths` that are existing files.
+
+    Each parent directory is listed once with os.scandir instead of stat-ing
+    every path.
+    """
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or '.', []).append(path)
+    present = set()
+    for directory, dir_paths in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                names = {e.name for e in entries if e.is_file()}
+        except OSError:
+            continue
+        present.update(p for p in dir_paths if os.path.basename(p) in names)
+    return present
+
+
 def main():
     parser = argparse.ArgumentParser()
     # default to project root/scan_results
@@ -104,65 +225,41 @@ def main():
     structure_path = args.structure
     endpoints_path = args.endpoints
 
-    if not os.path.exists(structure_path):
+    present = existing_files((structure_path, endpoints_path))
+    if structure_path not in present:
         print('structure.json not found at', structure_path)
         return
-    if not os.path.exists(endpoints_path):
+    if endpoints_path not in present:
         print('endpoints.json not found at', endpoints_path)
         return
 
     structure = load_json(structure_path)
-    endpoints = load_json(endpoints_path)
+
+    if args.backup:
+        # Write the backup before forms are mutated below, reusing the loaded data
+        bak_path = structure_path + '.bak.' + datetime.now().strftime('%Y%m%d_%H%M%S')
+        save_json(bak_path, structure)
+        print('Backup saved to', bak_path)
 
     forms = structure.get('forms', [])
     print(f'Loaded {len(forms)} forms from {structure_path}')
 
-    desc_map = build_description_map(endpoints)
-
-    seen = set()
-    unique_forms = []
-    duplicates = 0
-
-    for f in forms:
-        sig = form_signature(f)
-        if sig in seen:
-            duplicates += 1
-            continue
-        seen.add(sig)
+    desc_map = build_description_map(endpoints_path)
+    describe = build_description_lookup(desc_map)
 
-        # Normalize action and add description if available
-        action = f.get('action') or ''
-        norm_action = normalize_action(action)
-        f['action'] = norm_action
+    # Compact unique forms into the front of the same list instead of building a second one
+    total = len(forms)
+    kept = 0
+    for f in iter_unique_forms(forms):
+        forms[kept] = annotate_form(f, describe)
+        kept += 1
+    del forms[kept:]
+    duplicates = total - kept
 
-        # Attach description from endpoints attack_surfaces if available
-        description = desc_map.get(norm_action)
-        if description:
-            f['feedback'] = description
-        else:
-            # attempt fuzzy match: try removing query or matching suffix
-            found = False
-            for path, desc in desc_map.items():
-                if path.endswith(norm_action) or norm_action.endswith(path):
-                    if desc:
-                        f['feedback'] = desc
-                        found = True
-                        break
-            if not found:
-                # leave empty feedback to be explicit
-                f.setdefault('feedback', '')
-
-        unique_forms.append(f)
-
-    print(f'Removed {duplicates} duplicate forms; {len(unique_forms)} unique remain')
+    print(f'Removed {duplicates} duplicate forms; {kept} unique remain')
 
     # Update structure object
-    structure['forms'] = unique_forms
-
-    if args.backup:
-        bak_path = structure_path + '.bak.' + datetime.now().strftime('%Y%m%d_%H%M%S')
-        save_json(bak_path, load_json(structure_path))
-        print('Backup saved to', bak_path)
+    structure['forms'] = forms
 
     save_json(structure_path, structure)
     print('Updated structure.json saved to', structure_path)
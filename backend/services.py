@@ -1,43 +1,153 @@
+import asyncio
+import aiofiles
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import json
 import logging
-from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+import os
+import re
+import shutil
+import tempfile
+from urllib.parse import urlparse, urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from bs4 import BeautifulSoup, SoupStrainer
 from zapv2 import ZAPv2
 from colorama import init, Fore, Style
-from typing import List, Dict
-import subprocess
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import shlex
 
+from curl_parser import parse_curl
+
+try:
+    import aiodns
+except ImportError:  # enumerate_subdomains falls back to threaded HTTPS probes
+    aiodns = None
+
+try:
+    import orjson
+except ImportError:  # save_results falls back to the stdlib json module
+    orjson = None
+
 # Initialize colorama for cross-platform colored output
 init()
 
+USER_AGENT = 'SecurityScanner/1.0'
+# Default timeout (seconds) for page requests
+REQUEST_TIMEOUT = 5
+
+# Analysis only looks at forms (with their inputs) and scripts, so only those subtrees are parsed
+_FORM_STRAINER = SoupStrainer(['form', 'script'])
+
+# Only these responses are parsed for forms; larger bodies are skipped
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+MAX_HTML_BYTES = 5 * 1024 * 1024
+# Static assets skipped without being fetched
+NON_HTML_EXTENSIONS = (
+    '.js', '.css', '.json', '.xml', '.txt', '.png', '.jpg', '.jpeg', '.gif', '.svg',
+    '.ico', '.webp', '.woff', '.woff2', '.ttf', '.eot', '.pdf', '.zip', '.mp4', '.mp3'
+)
+
+# ZAP status polling backs off from the initial to the max delay (seconds)
+POLL_INITIAL_DELAY = 0.1
+POLL_MAX_DELAY = 2.0
+
+# Seconds allowed for each command run by execute()
+CURL_TIMEOUT = 30
+
+# Wordlists larger than this are resolved with massdns when it is on PATH
+MASSDNS_MIN_CANDIDATES = 1000
+MASSDNS_RESOLVERS = os.environ.get('MASSDNS_RESOLVERS', 'resolvers.txt')
+MASSDNS_TIMEOUT = 300
+
+# Subdomain prefixes probed when no wordlist is given
+COMMON_SUBDOMAIN_PREFIXES = ['www', 'admin', 'api', 'dev', 'test', 'staging']
+
+class NoColorFormatter(logging.Formatter):
+    """Formatter that strips ANSI color codes, for the scan.log file handler."""
+
+    _ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+    def format(self, record):
+        return self._ANSI_RE.sub('', super().format(record))
+
+
+def _configure_logging(output_dir):
+    """Attach the scan.log and console handlers to this module's logger once.
+
+    Later scanners reuse the existing handlers instead of opening another
+    FileHandler on scan.log per instance.
+    """
+    logger = logging.getLogger(__name__)
+    if not logger.handlers:
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        file_handler = logging.FileHandler(f'{output_dir}/scan.log')
+        file_handler.setFormatter(NoColorFormatter(log_format))
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(log_format))
+        logger.addHandler(file_handler)
+        logger.addHandler(stream_handler)
+        logger.setLevel(logging.INFO)
+        # Handled here; don't emit a second copy through root handlers
+        logger.propagate = False
+    return logger
+
+
+def _canonicalize(url):
+    """Normalize a URL so equivalent spellings dedupe to one entry.
+
+    Lowercases scheme and host, sorts query parameters, drops the fragment and
+    strips a trailing slash from the path.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
+
+
 class SecurityScanner:
-    def __init__(self, target_url, output_dir="scan_results"):
+    def __init__(self, target_url, output_dir="scan_results", concurrency=10, per_domain_delay=1.5):
         self.target_url = target_url
         self.output_dir = output_dir
+        # Max page fetches in flight, and min seconds between requests to one domain
+        self.concurrency = concurrency
+        self.per_domain_delay = per_domain_delay
+        self._last_hit = {}
         self.discovered_endpoints = set()
+        # Canonical form -> first URL seen with it; dedupes spellings of one page
+        self._endpoint_keys = {}
         self.subdomains = set()
         self.forms = []
         self.attack_surfaces = []
+        # Canonical URLs already analyzed in this run
+        self._analyzed = set()
+        # Parsed pages shared by analyze_endpoint and analyze_structure, by canonical URL
+        self._page_cache = {}
         
         # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(f'{output_dir}/scan.log'),
-                logging.StreamHandler()
-            ]
+        self.logger = _configure_logging(output_dir)
+        
+        # Shared HTTP session so synchronous requests reuse pooled keep-alive connections
+        self.http = requests.Session()
+        self.http.headers['User-Agent'] = USER_AGENT
+        adapter = HTTPAdapter(
+            pool_connections=50,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.3)
         )
-        self.logger = logging.getLogger(__name__)
+        self.http.mount('http://', adapter)
+        self.http.mount('https://', adapter)
         
         # Initialize ZAP API
         self.zap = ZAPv2(
             proxies={'http': 'http://127.0.0.1:8080', 'https': 'http://127.0.0.1:8080'}
         )
 
+    def _http_get(self, url, timeout=REQUEST_TIMEOUT):
+        """GET `url` through the shared pooled session."""
+        return self.http.get(url, timeout=timeout)
+
     def validate_url(self):
         """Validate if the URL is accessible and properly formatted."""
         try:
@@ -45,28 +155,59 @@ class SecurityScanner:
             if parsed.scheme not in ["http", "https"]:
                 raise ValueError("URL must start with http:// or https://")
             
-            self.logger.info(f"{Fore.BLUE}Validating URL: {self.target_url}{Style.RESET_ALL}")
-            response = requests.get(self.target_url, timeout=10, 
-                                 headers={'User-Agent': 'SecurityScanner/1.0'})
+            self.logger.info(Fore.BLUE + "Validating URL: %s" + Style.RESET_ALL, self.target_url)
+            response = self._http_get(self.target_url, timeout=10)
             
             if response.status_code < 400:
-                self.logger.info(f"{Fore.GREEN}URL is valid and accessible{Style.RESET_ALL}")
+                self.logger.info(Fore.GREEN + "URL is valid and accessible" + Style.RESET_ALL)
                 return True
             else:
-                self.logger.error(f"{Fore.RED}URL returned status code: {response.status_code}{Style.RESET_ALL}")
+                self.logger.error(Fore.RED + "URL returned status code: %s" + Style.RESET_ALL, response.status_code)
                 return False
                 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"{Fore.RED}Error accessing URL: {str(e)}{Style.RESET_ALL}")
+            self.logger.error(Fore.RED + "Error accessing URL: %s" + Style.RESET_ALL, e)
             return False
         except ValueError as e:
-            self.logger.error(f"{Fore.RED}{str(e)}{Style.RESET_ALL}")
+            self.logger.error(Fore.RED + "%s" + Style.RESET_ALL, e)
             return False
 
+    async def _wait_for_scan(self, status, scan_id, label, on_poll=None):
+        """Poll a ZAP scan status until it reaches 100%, backing off between polls.
+
+        `on_poll` is awaited after every status check, including the final one.
+        """
+        delay = POLL_INITIAL_DELAY
+        while True:
+            progress = int(await asyncio.to_thread(status, scan_id))
+            if on_poll is not None:
+                await on_poll()
+            if progress >= 100:
+                return
+            self.logger.debug("%s progress: %s%%", label, progress)
+            await asyncio.sleep(delay)
+            delay = min(POLL_MAX_DELAY, delay * 1.5)
+
+    async def _analyze_worker(self, session, queue):
+        """Analyze URLs from `queue` until cancelled."""
+        while True:
+            url = await queue.get()
+            try:
+                await self.analyze_endpoint_async(session, url)
+            finally:
+                queue.task_done()
+
     def discover_endpoints(self):
         """Discover endpoints using recursive crawling and ZAP scanning."""
+        asyncio.run(self.discover_endpoints_async())
+
+    async def discover_endpoints_async(self):
+        """Discover endpoints using recursive crawling and ZAP scanning.
+
+        URLs are analyzed as the spider reports them rather than after it finishes.
+        """
         try:
-            self.logger.info(f"{Fore.BLUE}Starting endpoint discovery{Style.RESET_ALL}")
+            self.logger.info(Fore.BLUE + "Starting endpoint discovery" + Style.RESET_ALL)
             
             # Configure ZAP context
             context_id = self.zap.context.new_context('scan_context')
@@ -75,27 +216,41 @@ class SecurityScanner:
             # Start Spider scan
             scan_id = self.zap.spider.scan(self.target_url)
             
-            # Monitor spider progress
-            while int(self.zap.spider.status(scan_id)) < 100:
-                progress = self.zap.spider.status(scan_id)
-                self.logger.info(f"Spider progress: {progress}%")
-                time.sleep(2)
-            
-            # Get discovered URLs
-            urls = self.zap.spider.results(scan_id)
-            for url in urls:
-                self.discovered_endpoints.add(url)
-                self.logger.info(f"Discovered: {url}")
-                self.analyze_endpoint(url)
+            queue = asyncio.Queue()
+            seen = set()
+
+            async def enqueue_new_results():
+                urls = await asyncio.to_thread(self.zap.spider.results, scan_id)
+                for raw_url in urls:
+                    if raw_url in seen:
+                        continue
+                    seen.add(raw_url)
+                    key = _canonicalize(raw_url)
+                    if key not in self._endpoint_keys:
+                        self._endpoint_keys[key] = raw_url
+                        self.discovered_endpoints.add(raw_url)
+                        self.logger.info("Discovered: %s", raw_url)
+                        queue.put_nowait(raw_url)
+
+            async with self._client_session() as session:
+                workers = [
+                    asyncio.create_task(self._analyze_worker(session, queue))
+                    for _ in range(self.concurrency)
+                ]
+                try:
+                    # Monitor spider progress, feeding new URLs to the workers
+                    await self._wait_for_scan(self.zap.spider.status, scan_id, "Spider", enqueue_new_results)
+                    await queue.join()
+                finally:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
             
             # Start Active Scan
             ascan_id = self.zap.ascan.scan(self.target_url)
             
             # Monitor active scan progress
-            while int(self.zap.ascan.status(ascan_id)) < 100:
-                progress = self.zap.ascan.status(ascan_id)
-                self.logger.info(f"Active scan progress: {progress}%")
-                time.sleep(2)
+            await self._wait_for_scan(self.zap.ascan.status, ascan_id, "Active scan")
             
             # Get alerts (potential vulnerabilities)
             alerts = self.zap.core.alerts()
@@ -117,16 +272,103 @@ class SecurityScanner:
                 'attack_surfaces': self.attack_surfaces
             })
             
-            self.logger.info(f"{Fore.GREEN}Endpoint discovery completed. Found {len(self.discovered_endpoints)} endpoints and {len(self.attack_surfaces)} potential vulnerabilities{Style.RESET_ALL}")
+            self.logger.info(
+                Fore.GREEN + "Endpoint discovery completed. Found %d endpoints and %d potential vulnerabilities" + Style.RESET_ALL,
+                len(self.discovered_endpoints), len(self.attack_surfaces)
+            )
             
         except Exception as e:
-            self.logger.error(f"{Fore.RED}Error during endpoint discovery: {str(e)}{Style.RESET_ALL}")
+            self.logger.error(Fore.RED + "Error during endpoint discovery: %s" + Style.RESET_ALL, e)
+
+    def _client_session(self):
+        """Create an HTTP client session and a fresh fetch semaphore for the current event loop."""
+        self._sem = asyncio.Semaphore(self.concurrency)
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            headers={'User-Agent': USER_AGENT}
+        )
+
+    async def _wait_for_domain(self, url):
+        """Sleep until `url`'s domain may be hit again without exceeding per_domain_delay."""
+        domain = urlparse(url).netloc
+        now = time.monotonic()
+        # Reserve the next slot before sleeping so concurrent fetches queue up behind it
+        slot = max(now, self._last_hit.get(domain, 0) + self.per_domain_delay)
+        self._last_hit[domain] = slot
+        await asyncio.sleep(slot - now)
+
+    async def _fetch(self, session, url):
+        """Fetch a URL and return the raw response body.
+
+        Returns None without reading the body when the response is not HTML or
+        is larger than MAX_HTML_BYTES.
+        """
+        # Wait for the domain's slot first so rate-limited URLs don't hold a fetch slot
+        await self._wait_for_domain(url)
+        async with self._sem:
+            async with session.get(url) as response:
+                ctype = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if ctype and ctype not in HTML_CONTENT_TYPES:
+                    return None
+                if (response.content_length or 0) > MAX_HTML_BYTES:
+                    return None
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(64 * 1024):
+                    body += chunk
+                    if len(body) > MAX_HTML_BYTES:
+                        return None
+                return bytes(body)
+
+    async def _get_soup(self, session, url):
+        """Return the parsed page for `url`, fetching and parsing it only once per run.
+
+        Returns None for pages that are not HTML (see _fetch).
+        """
+        key = _canonicalize(url)
+        if key in self._page_cache:
+            return self._page_cache[key]
+        soup = None
+        if not urlsplit(url).path.lower().endswith(NON_HTML_EXTENSIONS):
+            body = await self._fetch(session, url)
+            if body is not None:
+                soup = BeautifulSoup(body, 'lxml', parse_only=_FORM_STRAINER)
+        self._page_cache[key] = soup
+        return soup
+
+    def _unique_forms(self):
+        """Return self.forms without duplicates, keyed by action, method and input names."""
+        seen = set()
+        unique = []
+        for form in self.forms:
+            key = (
+                form['action'],
+                form['method'],
+                tuple(sorted(inp['name'] for inp in form['inputs']))
+            )
+            if key not in seen:
+                seen.add(key)
+                unique.append(form)
+        return unique
+
+    async def analyze_endpoints_async(self, urls):
+        """Analyze several endpoints concurrently."""
+        async with self._client_session() as session:
+            await asyncio.gather(*(self.analyze_endpoint_async(session, url) for url in urls))
 
     def analyze_endpoint(self, url):
         """Analyze an endpoint for potential attack vectors."""
+        asyncio.run(self.analyze_endpoints_async([url]))
+
+    async def analyze_endpoint_async(self, session, url):
+        """Analyze an endpoint for potential attack vectors."""
+        key = _canonicalize(url)
+        if key in self._analyzed:
+            return
+        self._analyzed.add(key)
         try:
-            response = requests.get(url, timeout=5)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = await self._get_soup(session, url)
+            if soup is None:
+                return
             
             # Find forms
             forms = soup.find_all('form')
@@ -156,46 +398,135 @@ class SecurityScanner:
                     pass
                     
         except Exception as e:
-            self.logger.warning(f"Error analyzing {url}: {str(e)}")
+            self.logger.warning("Error analyzing %s: %s", url, e)
+
+    def enumerate_subdomains(self, wordlist=None, max_workers=50):
+        """Enumerate subdomains using DNS queries."""
+        asyncio.run(self.enumerate_subdomains_async(wordlist, max_workers))
 
-    def enumerate_subdomains(self):
-        """Enumerate subdomains using DNS queries and web scraping."""
+    async def _resolve_subdomains(self, candidates):
+        """Return the candidates that have an A record, resolving them concurrently."""
+        resolver = aiodns.DNSResolver()
+        results = await asyncio.gather(
+            *(resolver.query(subdomain, "A") for subdomain in candidates),
+            return_exceptions=True
+        )
+        return [
+            subdomain for subdomain, result in zip(candidates, results)
+            if not isinstance(result, BaseException)
+        ]
+
+    async def _massdns_subdomains(self, candidates):
+        """Return the candidates with A records, resolved in one massdns batch.
+
+        Returns None when massdns fails or times out, so the caller can fall back.
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.txt') as wordlist_file:
+            wordlist_file.write('\n'.join(candidates))
+            wordlist_file.flush()
+            process = await asyncio.create_subprocess_exec(
+                'massdns', '-r', MASSDNS_RESOLVERS, '-t', 'A', '-o', 'J', wordlist_file.name,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), MASSDNS_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                self.logger.warning("massdns timed out after %d seconds", MASSDNS_TIMEOUT)
+                return None
+        if process.returncode != 0:
+            self.logger.warning(
+                "massdns exited with status %d: %s",
+                process.returncode, stderr.decode(errors='replace').strip()
+            )
+            return None
+        found = set()
+        for line in stdout.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('status') == 'NOERROR' and (record.get('data') or {}).get('answers'):
+                found.add(record['name'].rstrip('.'))
+        return [subdomain for subdomain in candidates if subdomain in found]
+
+    def _probe_subdomains(self, candidates, max_workers):
+        """Return the candidates answering HTTPS with a status below 400, probing on a thread pool."""
+        def probe(subdomain):
+            try:
+                return self._http_get(f"https://{subdomain}").status_code < 400
+            except requests.exceptions.RequestException:
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(probe, subdomain): subdomain for subdomain in candidates}
+            return [futures[future] for future in as_completed(futures) if future.result()]
+
+    async def enumerate_subdomains_async(self, wordlist=None, max_workers=50):
+        """Enumerate subdomains of the target from `wordlist` prefixes.
+
+        Wordlists over MASSDNS_MIN_CANDIDATES entries are resolved in one
+        massdns run when massdns is installed and the MASSDNS_RESOLVERS file
+        exists. Otherwise, or if massdns fails, names are resolved
+        concurrently with aiodns when it is installed, or probed over HTTPS on
+        a pool of `max_workers` threads. `wordlist` defaults to
+        COMMON_SUBDOMAIN_PREFIXES.
+        """
         try:
-            self.logger.info(f"{Fore.BLUE}Starting subdomain enumeration{Style.RESET_ALL}")
+            self.logger.info(Fore.BLUE + "Starting subdomain enumeration" + Style.RESET_ALL)
             
             parsed_url = urlparse(self.target_url)
-            domain = parsed_url.netloc
+            domain = parsed_url.hostname
             
-            # Basic subdomain enumeration using common prefixes
-            common_prefixes = ['www', 'admin', 'api', 'dev', 'test', 'staging']
-            
-            for prefix in common_prefixes:
-                subdomain = f"{prefix}.{domain}"
-                try:
-                    response = requests.get(f"https://{subdomain}", timeout=5)
-                    if response.status_code < 400:
-                        self.subdomains.add(subdomain)
-                        self.logger.info(f"Found subdomain: {subdomain}")
-                except:
-                    continue
+            candidates = [f"{prefix}.{domain}" for prefix in (wordlist or COMMON_SUBDOMAIN_PREFIXES)]
+            found = None
+            if len(candidates) > MASSDNS_MIN_CANDIDATES and shutil.which('massdns'):
+                if os.path.exists(MASSDNS_RESOLVERS):
+                    found = await self._massdns_subdomains(candidates)
+                else:
+                    self.logger.warning("massdns resolvers file %s not found", MASSDNS_RESOLVERS)
+                if found is None:
+                    self.logger.warning("Falling back from massdns to per-name resolution")
+            if found is None and aiodns is not None:
+                found = await self._resolve_subdomains(candidates)
+            elif found is None:
+                found = await asyncio.to_thread(self._probe_subdomains, candidates, max_workers)
+            for subdomain in found:
+                self.subdomains.add(subdomain)
+                self.logger.info("Found subdomain: %s", subdomain)
             
             # Save results
             self.save_results("subdomains.json", list(self.subdomains))
             
-            self.logger.info(f"{Fore.GREEN}Subdomain enumeration completed. Found {len(self.subdomains)} subdomains{Style.RESET_ALL}")
+            self.logger.info(Fore.GREEN + "Subdomain enumeration completed. Found %d subdomains" + Style.RESET_ALL, len(self.subdomains))
             
         except Exception as e:
-            self.logger.error(f"{Fore.RED}Error during subdomain enumeration: {str(e)}{Style.RESET_ALL}")
+            self.logger.error(Fore.RED + "Error during subdomain enumeration: %s" + Style.RESET_ALL, e)
 
     def analyze_structure(self):
         """Analyze the structure of the web application."""
+        asyncio.run(self.analyze_structure_async())
+
+    async def analyze_structure_async(self):
+        """Analyze the structure of the web application, fetching all endpoints concurrently."""
         try:
-            self.logger.info(f"{Fore.BLUE}Starting structure analysis{Style.RESET_ALL}")
+            self.logger.info(Fore.BLUE + "Starting structure analysis" + Style.RESET_ALL)
             
-            for endpoint in self.discovered_endpoints:
+            endpoints = list(self.discovered_endpoints)
+            async with self._client_session() as session:
+                soups = await asyncio.gather(
+                    *(self._get_soup(session, endpoint) for endpoint in endpoints),
+                    return_exceptions=True
+                )
+
+            for endpoint, soup in zip(endpoints, soups):
                 try:
-                    response = requests.get(endpoint, timeout=5)
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    if isinstance(soup, BaseException):
+                        raise soup
+                    if soup is None:
+                        continue
                     
                     # Find forms
                     forms = soup.find_all('form')
@@ -214,55 +545,175 @@ class SecurityScanner:
                         self.forms.append(form_data)
                         
                 except Exception as e:
-                    self.logger.warning(f"Error analyzing {endpoint}: {str(e)}")
+                    self.logger.warning("Error analyzing %s: %s", endpoint, e)
             
             # Save results
+            self.forms = self._unique_forms()
             self.save_results("structure.json", {
                 'forms': self.forms
             })
             
-            self.logger.info(f"{Fore.GREEN}Structure analysis completed. Found {len(self.forms)} forms{Style.RESET_ALL}")
+            self.logger.info(Fore.GREEN + "Structure analysis completed. Found %d forms" + Style.RESET_ALL, len(self.forms))
             
         except Exception as e:
-            self.logger.error(f"{Fore.RED}Error during structure analysis: {str(e)}{Style.RESET_ALL}")
+            self.logger.error(Fore.RED + "Error during structure analysis: %s" + Style.RESET_ALL, e)
 
     def save_results(self, filename, data):
         """Save scan results to a JSON file."""
         try:
+            if orjson is not None:
+                with open(f"{self.output_dir}/{filename}", 'wb') as f:
+                    f.write(orjson.dumps(data, default=list, option=orjson.OPT_INDENT_2))
+                return
             with open(f"{self.output_dir}/{filename}", 'w') as f:
-                json.dump(data, f, indent=4)
+                json.dump(data, f, indent=4, default=list)
         except Exception as e:
-            self.logger.error(f"Error saving results to {filename}: {str(e)}")
+            self.logger.error("Error saving results to %s: %s", filename, e)
 
     def run_scan(self):
         """Run the complete scan process."""
-        self.logger.info(f"{Fore.BLUE}Starting security scan for {self.target_url}{Style.RESET_ALL}")
+        self.logger.info(Fore.BLUE + "Starting security scan for %s" + Style.RESET_ALL, self.target_url)
         
         if not self.validate_url():
             return
         
-        self.discover_endpoints()
-        self.enumerate_subdomains()
-        self.analyze_structure()
+        asyncio.run(self.discover_endpoints_async())
+        asyncio.run(self.enumerate_subdomains_async())
+        asyncio.run(self.analyze_structure_async())
         
-        self.logger.info(f"{Fore.GREEN}Scan completed successfully{Style.RESET_ALL}")
-def save_report_to_file(content: str, filename: str):
+        self.logger.info(Fore.GREEN + "Scan completed successfully" + Style.RESET_ALL)
+async def save_report_to_file(content: str, filename: str, base_dir: Optional[str] = None):
     """
     Save a report to a file.
     
     Args:
         content (str): The content of the report
         filename (str): The filename to save the report to
+        base_dir (str, optional): Directory for reports. Defaults to the
+            VULNERAX_REPORTS_DIR environment variable, or ./reports.
+
+    Sync callers can use asyncio.run(save_report_to_file(...)).
+    Filenames that would resolve outside base_dir are rejected.
     """
+    base_dir = os.path.realpath(base_dir or os.environ.get('VULNERAX_REPORTS_DIR', './reports'))
+    path = os.path.realpath(os.path.join(base_dir, filename))
+    if os.path.isabs(filename) or path == base_dir or os.path.commonpath([base_dir, path]) != base_dir:
+        return {"success": False, "error": f"Invalid report filename: {filename}"}
     try:
-        with open(f'/Users/yuktha/Documents/VulneraX/agent/reports/{filename}', 'w') as file:
-            file.write(content)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        async with aiofiles.open(path, 'w') as file:
+            await file.write(content)
         print(f"Report saved successfully to {filename}")
         return {"success": True, "message": f"Report saved to {filename}"}
     except Exception as e:
         print(f"Error saving report: {str(e)}")
         return {"success": False, "error": str(e)}
 
+async def _run_curl_process(args: List[str]) -> Dict:
+    """Run a curl command in a subprocess and return its result dict."""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), CURL_TIMEOUT)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return {
+            "success": False,
+            "error": f"Command execution timed out after {CURL_TIMEOUT} seconds",
+            "status_code": -1
+        }
+    if process.returncode == 0:
+        return {
+            "success": True,
+            "output": stdout.decode(errors="replace").strip(),
+            "status_code": 0
+        }
+    return {
+        "success": False,
+        "error": stderr.decode(errors="replace").strip(),
+        "status_code": process.returncode
+    }
+
+
+def _curl_exit_code(error: Exception) -> int:
+    """Return the exit code curl would have failed with for an aiohttp error, or -1."""
+    if isinstance(error, asyncio.TimeoutError):
+        return 28  # CURLE_OPERATION_TIMEDOUT
+    if isinstance(error, aiohttp.ClientConnectorCertificateError):
+        return 60  # CURLE_PEER_FAILED_VERIFICATION
+    if isinstance(error, aiohttp.ClientSSLError):
+        return 35  # CURLE_SSL_CONNECT_ERROR
+    if isinstance(error, aiohttp.ClientConnectorDNSError):
+        return 6  # CURLE_COULDNT_RESOLVE_HOST
+    if isinstance(error, aiohttp.ClientConnectorError):
+        return 7  # CURLE_COULDNT_CONNECT
+    if isinstance(error, aiohttp.TooManyRedirects):
+        return 47  # CURLE_TOO_MANY_REDIRECTS
+    if isinstance(error, aiohttp.InvalidURL):
+        return 3  # CURLE_URL_MALFORMAT
+    return -1
+
+
+async def _execute_one(session: aiohttp.ClientSession, curl_command: str) -> Dict:
+    """Execute a single curl command, in-process when its options allow it."""
+    print(f"Executing command: {curl_command}")
+
+    if not curl_command or not curl_command.strip().startswith("curl"):
+        return {
+            "success": False,
+            "error": "Invalid curl command. Command must start with 'curl'.",
+            "status_code": -1
+        }
+
+    try:
+        request = parse_curl(curl_command)
+        if request is None:
+            return await _run_curl_process(shlex.split(curl_command))
+        async with session.request(**request) as response:
+            body = await response.text(errors="replace")
+        return {
+            "success": True,
+            "output": body.strip(),
+            "status_code": 0
+        }
+    except asyncio.TimeoutError as e:
+        timeout = request['timeout'].total if 'timeout' in request else CURL_TIMEOUT
+        return {
+            "success": False,
+            "error": f"Command execution timed out after {timeout:g} seconds",
+            "status_code": _curl_exit_code(e)
+        }
+    except Exception as e:
+        # Failed requests report the exit code curl would have returned
+        return {
+            "success": False,
+            "error": f"Error executing curl command: {str(e)}",
+            "status_code": _curl_exit_code(e)
+        }
+
+
+async def execute_async(curl: List[str]) -> List[Dict]:
+    """
+    Execute a list of curl commands concurrently and return the results.
+
+    Commands are sent with aiohttp instead of spawning a curl process each.
+    Commands using curl options that parse_curl does not handle still go
+    through curl. Results are in the same order as `curl`; see execute().
+    Failed in-process requests carry curl's exit code as status_code (6, 7,
+    28, ...), or -1 when curl has no equivalent.
+    """
+    # Like separate curl invocations: no cookies carried between commands
+    async with aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=CURL_TIMEOUT),
+        cookie_jar=aiohttp.DummyCookieJar()
+    ) as session:
+        return await asyncio.gather(*(_execute_one(session, c) for c in curl))
+
+
 def execute(curl: List[str]) -> List[Dict]:
     """
     Execute a list of curl commands and return the results.
@@ -277,55 +728,13 @@ def execute(curl: List[str]) -> List[Dict]:
             - error (str, if failed)
             - status_code (int)
     """
-    results = []
-
-    for curl_command in curl:
-        print(f"Executing command: {curl_command}")
-
-        if not curl_command or not curl_command.strip().startswith("curl"):
-            results.append({
-                "success": False,
-                "error": "Invalid curl command. Command must start with 'curl'.",
-                "status_code": -1
-            })
-            continue
-
-        try:
-            args = shlex.split(curl_command)
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                results.append({
-                    "success": True,
-                    "output": result.stdout.strip(),
-                    "status_code": 0
-                })
-            else:
-                results.append({
-                    "success": False,
-                    "error": result.stderr.strip(),
-                    "status_code": result.returncode
-                })
-        except subprocess.TimeoutExpired:
-            results.append({
-                "success": False,
-                "error": "Command execution timed out after 30 seconds",
-                "status_code": -1
-            })
-
-        except Exception as e:
-            results.append({
-                "success": False,
-                "error": f"Error executing curl command: {str(e)}",
-                "status_code": -1
-            })
-
-    return results
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(execute_async(curl))
+    # Called from inside an event loop (e.g. an async agent): run on a separate thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, execute_async(curl)).result()
 
 def run_security_scan(target_url: str) -> Dict:
     print(f"--- Tool: run_security_scan called with input: {target_url} ---")
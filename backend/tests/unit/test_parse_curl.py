@@ -0,0 +1,85 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for translating curl commands into aiohttp requests."""
+
+import pytest
+
+from curl_parser import parse_curl
+
+
+def test_combined_flags() -> None:
+    request = parse_curl("curl -sSLk https://example.com/")
+    assert request["allow_redirects"] is True
+    assert request["ssl"] is False
+    assert request["method"] == "GET"
+    assert request["url"] == "https://example.com/"
+
+
+def test_attached_request_method() -> None:
+    request = parse_curl("curl -XPOST https://example.com/login")
+    assert request["method"] == "POST"
+    assert "data" not in request
+
+
+def test_data_raw_is_sent_verbatim() -> None:
+    request = parse_curl("curl --data-raw '@user=a' -d 'b=2' https://example.com/")
+    assert request["method"] == "POST"
+    assert request["data"] == "@user=a&b=2"
+    assert request["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+def test_header_names_are_case_insensitive() -> None:
+    request = parse_curl(
+        "curl -H 'content-type: application/json' -H 'user-agent: x' -A y "
+        "-d '{\"a\":1}' https://example.com/"
+    )
+    headers = request["headers"]
+    assert headers.getall("Content-Type") == ["application/json"]
+    assert headers.getall("User-Agent") == ["y"]
+
+
+def test_headers_auth_and_max_time() -> None:
+    request = parse_curl(
+        "curl -H 'X-Test: 1' -u admin:secret -m 5 -b 'sid=abc' https://example.com/"
+    )
+    assert request["headers"] == {"X-Test": "1", "Cookie": "sid=abc"}
+    assert request["auth"].login == "admin"
+    assert request["timeout"].total == 5
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "curl -d @body.txt https://example.com/",
+        "curl -b cookies.txt https://example.com/",
+        "curl -F file=@a.txt https://example.com/",
+        "curl https://example.com/ https://example.org/",
+        "curl -s",
+    ],
+)
+def test_unsupported_commands_fall_back_to_curl(command: str) -> None:
+    assert parse_curl(command) is None
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("example.com/path", "http://example.com/path"),
+        ("localhost:8000/api?q=1", "http://localhost:8000/api?q=1"),
+        ("https://example.com", "https://example.com"),
+    ],
+)
+def test_scheme_less_urls_default_to_http(url: str, expected: str) -> None:
+    assert parse_curl(f"curl {url}")["url"] == expected
+    assert parse_curl(f"curl --url {url}")["url"] == expected
@@ -0,0 +1,37 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for where the chat UI is served."""
+
+from fastapi.testclient import TestClient
+
+from api import app
+
+client = TestClient(app)
+
+
+def test_chat_ui_served_under_static() -> None:
+    for path in ("/static/", "/static/index.html"):
+        response = client.get(path)
+        assert response.status_code == 200
+        assert "text/html" in response.headers["content-type"]
+
+
+def test_root_still_redirects_to_adk_web_ui() -> None:
+    response = client.get("/", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "/dev-ui/"
+
+
+def test_api_routes_not_shadowed_by_static_mount() -> None:
+    assert client.get("/health").json() == {"status": "healthy"}